@@ -5,21 +5,212 @@ Advanced candidate validation with LinkedIn verification,
 MongoDB cross-reference, and quality scoring.
 """
 import os
-import sys
 import json
 import re
-from typing import List, Dict, Any, Optional, Tuple
+import atexit
+import bisect
+import hashlib
+import functools
+import copy
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Set, Tuple
+import numpy as np
 from pymongo import MongoClient
+from bson import ObjectId
 import certifi
 from dotenv import load_dotenv
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from src.models.candidate import CandidateProfile
 from src.services.gpt_service import gpt_service
 from src.utils.logger import get_logger
+from src.utils.helpers import load_json_file
 logger = get_logger(__name__)
 load_dotenv()
+_CA_FILE = certifi.where()
+_QUALITY_CACHE_SIZE = 4096
+_GPT_CACHE_SIZE = 1024
+_DOC_CACHE_SIZE = 256
+_LINKEDIN_ID_RE = re.compile(r'^[a-zA-Z0-9_-]+\Z')
+_LINKEDIN_INDICATORS = (
+    'linkedin', 'professional network', 'connections',
+    'endorsements', 'recommendations', 'profile'
+)
+_LEADERSHIP_TERMS = ('led', 'managed', 'directed', 'supervised', 'oversaw', 'headed')
+_ACHIEVEMENT_TERMS = ('achieved', 'improved', 'increased', 'reduced', 'delivered', 'implemented')
+_SKILL_TERMS = ('expertise', 'proficient', 'skilled', 'experienced', 'specialist')
+def _keyword_re(terms: Tuple[str, ...]) -> re.Pattern:
+    """Compile a whole-word alternation matching any of the given terms."""
+    return re.compile(r'\b(?:' + '|'.join(re.escape(term) for term in terms) + r')\b')
+def _mongo_id_variants(candidate_id: Any) -> List[Any]:
+    """Ids to match a candidate by: the raw id plus its ObjectId form when it is a 24-hex string."""
+    if isinstance(candidate_id, str) and ObjectId.is_valid(candidate_id):
+        return [candidate_id, ObjectId(candidate_id)]
+    return [candidate_id]
+_EXPERIENCE_CATEGORIES = (
+    ("Leadership", _LEADERSHIP_TERMS),
+    ("Achievement", _ACHIEVEMENT_TERMS),
+    ("Skill", _SKILL_TERMS)
+)
+# One alternation over every LinkedIn and experience keyword so a summary is scanned in a single pass
+_SUMMARY_KEYWORD_RE = _keyword_re(
+    _LINKEDIN_INDICATORS + _LEADERSHIP_TERMS + _ACHIEVEMENT_TERMS + _SKILL_TERMS
+)
+_SPECIFIC_JOB_REQUIREMENTS = MappingProxyType({
+    "tax_lawyer": (
+        "Must have JD (Juris Doctor) degree",
+        "Must be licensed attorney",
+        "Must have tax law experience",
+        "Should have IRS experience",
+        "Should have corporate tax knowledge"
+    ),
+    "junior_corporate_lawyer": (
+        "Must have JD degree", 
+        "Must be licensed attorney",
+        "Should have corporate law experience",
+        "Should have M&A experience",
+        "Entry to mid-level experience"
+    ),
+    "radiology": (
+        "Must have MD degree",
+        "Must have radiology residency/fellowship",
+        "Must have medical imaging experience",
+        "Should be board certified",
+        "Should have DICOM experience"
+    ),
+    "doctors_md": (
+        "Must have MD degree",
+        "Must have medical residency",
+        "Must be licensed physician",
+        "Should have clinical experience",
+        "Should have patient care experience"
+    ),
+    "biology_expert": (
+        "Must have advanced degree in biology/life sciences",
+        "Should have research experience",
+        "Should have publication record",
+        "Should have laboratory experience"
+    ),
+    "mathematics_phd": (
+        "Must have PhD in Mathematics",
+        "Should have research experience",
+        "Should have publication record",
+        "Should have theoretical/applied math expertise"
+    ),
+    "quantitative_finance": (
+        "Should have finance/economics degree",
+        "Must have quantitative analysis experience",
+        "Should have financial modeling skills",
+        "Should have programming/statistical skills"
+    ),
+    "bankers": (
+        "Should have finance/business degree",
+        "Must have banking experience",
+        "Should have client relationship experience",
+        "Should have financial services background"
+    ),
+    "mechanical_engineers": (
+        "Must have engineering degree",
+        "Must have mechanical engineering experience",
+        "Should have design/manufacturing experience",
+        "Should have technical project experience"
+    ),
+    "anthropology": (
+        "Must have degree in anthropology/social sciences",
+        "Should have research experience",
+        "Should have fieldwork experience",
+        "Should have cultural analysis skills"
+    )
+})
+_GPT_VALIDATION_PROMPT = """
+You are an expert recruiter with deep knowledge across all professional domains. 
+Your task is to evaluate if a candidate is truly suitable for a specific job category.
+JOB CATEGORY: {job_title}
+JOB REQUIREMENTS:
+{job_requirements}
+CANDIDATE PROFILE:
+{candidate_summary}
+Please evaluate this candidate's suitability for the {job_category} role.
+Respond in JSON format:
+{{
+    "is_suitable": true/false,
+    "confidence": 0.0-1.0,
+    "reasoning": "Detailed explanation of why the candidate is or isn't suitable",
+    "strengths": ["List of candidate strengths relevant to the role"],
+    "weaknesses": ["List of concerns or gaps"],
+    "experience_match": 0.0-1.0,
+    "skills_match": 0.0-1.0,
+    "education_match": 0.0-1.0,
+    "overall_score": 0.0-1.0,
+    "recommendations": ["What would make this candidate more suitable"]
+}}
+Be strict in your evaluation. Only mark as suitable if the candidate genuinely fits the role requirements.
+"""
+# (label, candidate_data key) pairs rendered into the GPT profile, in prompt order
+_GPT_PROFILE_FIELDS = (
+    ("Name", "name"),
+    ("Current Position", "position"),
+    ("Current Company", "company"),
+    ("Location", "location"),
+    ("Industry", "industry"),
+    ("Education", "education"),
+    ("Experience", "experience"),
+    ("Skills", "skills"),
+    ("Profile Summary", "summary"),
+    ("Full Profile", "full_profile")
+)
+# Strict structured-output schema for validate_candidate_with_gpt; every field is guaranteed present
+_GPT_VALIDATION_SCHEMA = {
+    "name": "candidate_validation",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "is_suitable": {"type": "boolean"},
+            "confidence": {"type": "number"},
+            "reasoning": {"type": "string"},
+            "strengths": {"type": "array", "items": {"type": "string"}},
+            "weaknesses": {"type": "array", "items": {"type": "string"}},
+            "experience_match": {"type": "number"},
+            "skills_match": {"type": "number"},
+            "education_match": {"type": "number"},
+            "overall_score": {"type": "number"},
+            "recommendations": {"type": "array", "items": {"type": "string"}}
+        },
+        "required": [
+            "is_suitable", "confidence", "reasoning", "strengths", "weaknesses",
+            "experience_match", "skills_match", "education_match", "overall_score",
+            "recommendations"
+        ],
+        "additionalProperties": False
+    }
+}
+# Fields read by validate_candidate_with_mongodb; the embedding vector itself never leaves the server.
+_VALIDATION_PROJECTION = {
+    "name": 1,
+    "email": 1,
+    "linkedinId": 1,
+    "rerankSummary": 1,
+    "country": 1,
+    "has_embedding": {
+        "$and": [
+            {"$ne": [{"$ifNull": ["$embedding", None]}, None]},
+            {"$ne": ["$embedding", []]}
+        ]
+    }
+}
+@functools.lru_cache(maxsize=1)
+def _load_prompts_config() -> Dict[str, Any]:
+    """Load and cache the prompts configuration."""
+    return load_json_file("src/config/prompts.json")
 class EnhancedValidationAgent:
     """Advanced AI agent for candidate validation and quality scoring."""
+    __slots__ = (
+        "mongo_url", "db_name", "collection_name",
+        "quality_thresholds", "evaluation_thresholds",
+        "_level_bounds", "_level_labels",
+        "_mongo_client", "_collection",
+        "_quality_cache", "_gpt_validation_cache", "_doc_cache", "_requirements_cache"
+    )
     def __init__(self):
         self.mongo_url = os.getenv('MONGO_URL')
         self.db_name = "interview_data"
@@ -30,75 +221,137 @@ class EnhancedValidationAgent:
             'acceptable': 0.55,
             'poor': 0.40
         }
+        # Sorted lower bounds and their labels for bisect-based quality classification
+        self._level_bounds = [
+            self.quality_thresholds['acceptable'],
+            self.quality_thresholds['good'],
+            self.quality_thresholds['excellent']
+        ]
+        self._level_labels = ("poor", "acceptable", "good", "excellent")
         self.evaluation_thresholds = {
             'target_score': 0.80,
             'minimum_acceptable': 0.60,
             'rerun_threshold': 0.50
         }
+        self._mongo_client = None
+        self._collection = None
+        self._quality_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._gpt_validation_cache: "OrderedDict[Tuple[str, bytes], Dict[str, Any]]" = OrderedDict()
+        self._doc_cache: "OrderedDict[Any, Dict[str, Any]]" = OrderedDict()
+        self._requirements_cache: Dict[str, str] = {}
         logger.info("Enhanced Validation Agent initialized")
     def get_mongo_collection(self):
-        """Get MongoDB collection for validation."""
+        """Get MongoDB collection for validation, reusing a single pooled client."""
+        if self._collection is not None:
+            return self._collection
         if not self.mongo_url:
             logger.warning("MongoDB URL not configured")
             return None
         try:
-            client = MongoClient(self.mongo_url, tlsCAFile=certifi.where())
-            return client[self.db_name][self.collection_name]
+            self._mongo_client = MongoClient(
+                self.mongo_url,
+                tlsCAFile=_CA_FILE,
+                maxPoolSize=50,
+                minPoolSize=5,
+                maxIdleTimeMS=300000,
+                serverSelectionTimeoutMS=5000,
+                readPreference="secondaryPreferred"  # Validation is read-only
+            )
+            atexit.register(self._mongo_client.close)
+            self._collection = self._mongo_client[self.db_name][self.collection_name]
+            return self._collection
         except Exception as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
             return None
-    def validate_candidate_with_mongodb(self, candidate: CandidateProfile) -> Dict[str, Any]:
-        """Cross-validate candidate against original MongoDB data."""
+    def _prefetch_mongo_docs(self, candidates: List[CandidateProfile]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Fetch MongoDB documents for all candidates in a single $in query."""
         collection = self.get_mongo_collection()
-        if collection is None:
-            return {"validated": False, "error": "MongoDB not available"}
+        if collection is None or not candidates:
+            return None
         try:
-            mongo_doc = collection.find_one({"_id": candidate.id})
+            ids = [mongo_id for candidate in candidates if candidate.id for mongo_id in _mongo_id_variants(candidate.id)]
+            if not ids:
+                return {}
+            docs = collection.aggregate([
+                {"$match": {"_id": {"$in": ids}}},
+                {"$project": _VALIDATION_PROJECTION}
+            ], hint="_id_")
+            return {str(doc["_id"]): doc for doc in docs}
+        except Exception as e:
+            logger.error(f"MongoDB prefetch failed: {e}")
+            return None
+    def validate_candidate_with_mongodb(
+        self, 
+        candidate: CandidateProfile, 
+        mongo_doc: Optional[Dict[str, Any]] = None,
+        summary_lower: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Cross-validate candidate against original (optionally pre-fetched) MongoDB data."""
+        if not candidate.id:
+            # Placeholder candidates without an id can never match a document
+            mongo_doc = {}
+        if mongo_doc is None:
+            collection = self.get_mongo_collection()
+            if collection is None:
+                return {"validated": False, "error": "MongoDB not available"}
+        try:
+            if mongo_doc is None:
+                mongo_doc = next(collection.aggregate([
+                    {"$match": {"_id": {"$in": _mongo_id_variants(candidate.id)}}},
+                    {"$project": _VALIDATION_PROJECTION}
+                ], hint="_id_"), None)
             if not mongo_doc:
                 return {
                     "validated": False,
                     "error": "Candidate not found in MongoDB",
                     "data_integrity": False
                 }
-            validation_result = {
-                "validated": True,
-                "data_integrity": True,
-                "consistency_score": 0.0,
-                "issues": []
-            }
-            mongo_name = mongo_doc.get('name', '').strip()
-            if mongo_name and candidate.name:
+            consistency_score = 0.0
+            issues = []
+            # Only strip the fields that are compared; None values are treated as empty
+            mongo_name = (mongo_doc.get('name') or '').strip() if candidate.name else ''
+            if mongo_name:
                 name_similarity = self._calculate_string_similarity(mongo_name, candidate.name)
                 if name_similarity < 0.8:
-                    validation_result["issues"].append(f"Name mismatch: MongoDB='{mongo_name}', Candidate='{candidate.name}'")
+                    issues.append(f"Name mismatch: MongoDB='{mongo_name}', Candidate='{candidate.name}'")
                 else:
-                    validation_result["consistency_score"] += 0.3
-            mongo_email = mongo_doc.get('email', '').strip()
-            if mongo_email and candidate.email:
+                    consistency_score += 0.3
+            mongo_email = (mongo_doc.get('email') or '').strip() if candidate.email else ''
+            if mongo_email:
                 if mongo_email.lower() != candidate.email.lower():
-                    validation_result["issues"].append(f"Email mismatch: MongoDB='{mongo_email}', Candidate='{candidate.email}'")
+                    issues.append(f"Email mismatch: MongoDB='{mongo_email}', Candidate='{candidate.email}'")
                 else:
-                    validation_result["consistency_score"] += 0.2
-            mongo_linkedin_id = mongo_doc.get('linkedinId', '').strip()
+                    consistency_score += 0.2
+            mongo_linkedin_id = (mongo_doc.get('linkedinId') or '').strip()
             if mongo_linkedin_id and candidate.linkedin_id:
                 if mongo_linkedin_id != candidate.linkedin_id:
-                    validation_result["issues"].append(f"LinkedIn ID mismatch")
+                    issues.append(f"LinkedIn ID mismatch")
                 else:
-                    validation_result["consistency_score"] += 0.2
-            mongo_summary = mongo_doc.get('rerankSummary', '').strip()
-            if mongo_summary and candidate.summary:
-                summary_similarity = self._calculate_string_similarity(mongo_summary, candidate.summary)
+                    consistency_score += 0.2
+            mongo_summary = (mongo_doc.get('rerankSummary') or '').strip()
+            mongo_summary_len = len(mongo_summary)
+            if mongo_summary_len and candidate.summary:
+                summary_similarity = self._calculate_string_similarity(
+                    mongo_summary.lower(),
+                    summary_lower if summary_lower is not None else candidate.summary.lower(),
+                    lowered=True
+                )
                 if summary_similarity < 0.7:
-                    validation_result["issues"].append("Summary content mismatch")
+                    issues.append("Summary content mismatch")
                 else:
-                    validation_result["consistency_score"] += 0.3
-            validation_result["mongo_metadata"] = {
-                "has_embedding": bool(mongo_doc.get('embedding')),
-                "country": mongo_doc.get('country', ''),
-                "linkedin_id": mongo_linkedin_id,
-                "summary_length": len(mongo_summary) if mongo_summary else 0
+                    consistency_score += 0.3
+            return {
+                "validated": True,
+                "data_integrity": True,
+                "consistency_score": consistency_score,
+                "issues": issues,
+                "mongo_metadata": {
+                    "has_embedding": bool(mongo_doc.get('has_embedding')),
+                    "country": mongo_doc.get('country', ''),
+                    "linkedin_id": mongo_linkedin_id,
+                    "summary_length": mongo_summary_len
+                }
             }
-            return validation_result
         except Exception as e:
             logger.error(f"MongoDB validation failed for {candidate.id}: {e}")
             return {
@@ -106,7 +359,12 @@ class EnhancedValidationAgent:
                 "error": f"Validation error: {e}",
                 "data_integrity": False
             }
-    def enhanced_linkedin_validation(self, candidate: CandidateProfile) -> Dict[str, Any]:
+    def enhanced_linkedin_validation(
+        self, 
+        candidate: CandidateProfile, 
+        summary_lower: Optional[str] = None,
+        summary_terms: Optional[Set[str]] = None
+    ) -> Dict[str, Any]:
         """Advanced LinkedIn profile validation."""
         linkedin_result = {
             "is_valid": False,
@@ -115,7 +373,7 @@ class EnhancedValidationAgent:
             "issues": []
         }
         if candidate.linkedin_id:
-            if re.match(r'^[a-zA-Z0-9\-_]+$', candidate.linkedin_id):
+            if _LINKEDIN_ID_RE.match(candidate.linkedin_id):
                 linkedin_result["quality_indicators"].append("Valid LinkedIn ID format")
                 linkedin_result["completeness_score"] += 0.4
                 linkedin_result["is_valid"] = True
@@ -129,18 +387,27 @@ class EnhancedValidationAgent:
             else:
                 linkedin_result["issues"].append("Invalid LinkedIn URL format")
         if candidate.summary:
-            linkedin_indicators = [
-                'linkedin', 'professional network', 'connections',
-                'endorsements', 'recommendations', 'profile'
-            ]
-            summary_lower = candidate.summary.lower()
-            found_indicators = [ind for ind in linkedin_indicators if ind in summary_lower]
+            if summary_terms is None:
+                if summary_lower is None:
+                    summary_lower = candidate.summary.lower()
+                summary_terms = set(_SUMMARY_KEYWORD_RE.findall(summary_lower))
+            found_indicators = ", ".join(ind for ind in _LINKEDIN_INDICATORS if ind in summary_terms)
             if found_indicators:
-                linkedin_result["quality_indicators"].append(f"LinkedIn context in summary: {', '.join(found_indicators)}")
+                linkedin_result["quality_indicators"].append("LinkedIn context in summary: " + found_indicators)
                 linkedin_result["completeness_score"] += 0.3
         return linkedin_result
-    def validate_candidate_quality(self, candidate: CandidateProfile) -> Dict[str, Any]:
+    def validate_candidate_quality(
+        self, 
+        candidate: CandidateProfile, 
+        mongo_doc: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """Comprehensive candidate quality validation."""
+        cache_key = self._quality_cache_key(candidate)
+        cached = self._quality_cache.get(cache_key)
+        if cached is not None:
+            self._quality_cache.move_to_end(cache_key)
+            # Hand out copies so callers annotating a result can't alter the cached entry
+            return copy.deepcopy(cached)
         base_quality = candidate.calculate_quality_score()
         quality_result = {
             "base_quality_score": base_quality,
@@ -154,15 +421,17 @@ class EnhancedValidationAgent:
             },
             "recommendations": []
         }
-        linkedin_validation = self.enhanced_linkedin_validation(candidate)
+        summary_lower = (candidate.summary or "").lower()
+        summary_terms = set(_SUMMARY_KEYWORD_RE.findall(summary_lower)) if summary_lower else set()
+        linkedin_validation = self.enhanced_linkedin_validation(candidate, summary_lower, summary_terms)
         quality_result["validation_details"]["linkedin"] = linkedin_validation
-        mongodb_validation = self.validate_candidate_with_mongodb(candidate)
+        mongodb_validation = self.validate_candidate_with_mongodb(candidate, mongo_doc, summary_lower)
         quality_result["validation_details"]["mongodb"] = mongodb_validation
         exp_years = candidate.estimate_experience_years()
         experience_validation = {
             "estimated_years": exp_years,
             "experience_level": self._classify_experience_level(exp_years),
-            "experience_indicators": self._extract_experience_indicators(candidate.summary or "")
+            "experience_indicators": self._extract_experience_indicators(summary_terms)
         }
         quality_result["validation_details"]["experience"] = experience_validation
         completeness = self._validate_profile_completeness(candidate)
@@ -175,44 +444,79 @@ class EnhancedValidationAgent:
         if exp_years >= 2:
             enhanced_score += 0.05
         quality_result["enhanced_score"] = min(1.0, enhanced_score)
-        if enhanced_score >= self.quality_thresholds['excellent']:
-            quality_result["quality_level"] = "excellent"
-        elif enhanced_score >= self.quality_thresholds['good']:
-            quality_result["quality_level"] = "good"
-        elif enhanced_score >= self.quality_thresholds['acceptable']:
-            quality_result["quality_level"] = "acceptable"
-        else:
-            quality_result["quality_level"] = "poor"
+        quality_result["quality_level"] = self._level_labels[bisect.bisect_right(self._level_bounds, enhanced_score)]
         quality_result["recommendations"] = self._generate_quality_recommendations(
             candidate, linkedin_validation, mongodb_validation, experience_validation
         )
+        # Only cache fully validated results so transient MongoDB failures are retried
+        if mongodb_validation.get("validated"):
+            self._quality_cache[cache_key] = copy.deepcopy(quality_result)
+            if len(self._quality_cache) > _QUALITY_CACHE_SIZE:
+                self._quality_cache.popitem(last=False)
         return quality_result
+    @staticmethod
+    def _quality_cache_key(candidate: CandidateProfile) -> Tuple:
+        """Key covering every candidate field that feeds into quality validation."""
+        return (
+            candidate.id, candidate.name, candidate.email, candidate.summary,
+            candidate.linkedin_url, candidate.linkedin_id, candidate.country,
+            candidate.experience_years
+        )
     def validate_candidate_list(
         self, 
         candidates: List[CandidateProfile], 
-        job_category: str
+        job_category: str,
+        fast_fail: bool = False
     ) -> Dict[str, Any]:
-        """Validate entire candidate list with quality thresholds."""
+        """Validate entire candidate list with quality thresholds.
+        With fast_fail=True validation stops as soon as the poor-quality share
+        already rules out meeting the standards; the result then only covers
+        the candidates validated so far.
+        """
         validation_results = []
         quality_scores = []
+        max_poor = len(candidates) * 0.2  # Max 20% poor quality
+        poor_count = 0
+        acceptable_threshold = self.quality_thresholds['acceptable']
+        to_prefetch = [
+            candidate for candidate in candidates
+            if self._quality_cache_key(candidate) not in self._quality_cache
+        ]
+        mongo_docs = self._prefetch_mongo_docs(to_prefetch)
+        prefetched_ids = {str(candidate.id) for candidate in to_prefetch if candidate.id}
         for candidate in candidates:
-            validation = self.validate_candidate_quality(candidate)
+            # Missing from the prefetch means not in MongoDB. Candidates skipped as cached may have
+            # been evicted since, so for those (or a failed prefetch) None falls back to a per-candidate lookup
+            if mongo_docs is not None and str(candidate.id) in prefetched_ids:
+                mongo_doc = mongo_docs.get(str(candidate.id), {})
+            else:
+                mongo_doc = None
+            validation = self.validate_candidate_quality(candidate, mongo_doc)
             validation_results.append({
                 "candidate_id": candidate.id,
                 "candidate_name": candidate.name,
                 "validation": validation
             })
             quality_scores.append(validation["enhanced_score"])
-        avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0.0
+            if validation["enhanced_score"] < acceptable_threshold:
+                poor_count += 1
+                if fast_fail and poor_count > max_poor:
+                    logger.info(f"Fast-failing validation after {len(validation_results)}/{len(candidates)} candidates")
+                    break
+        scores = np.asarray(quality_scores, dtype=float)
+        avg_quality = float(scores.mean()) if scores.size else 0.0
+        poor, acceptable, good, excellent = np.bincount(
+            np.searchsorted(self._level_bounds, scores, side='right'), minlength=4
+        ).tolist()
         quality_distribution = {
-            "excellent": sum(1 for score in quality_scores if score >= self.quality_thresholds['excellent']),
-            "good": sum(1 for score in quality_scores if self.quality_thresholds['good'] <= score < self.quality_thresholds['excellent']),
-            "acceptable": sum(1 for score in quality_scores if self.quality_thresholds['acceptable'] <= score < self.quality_thresholds['good']),
-            "poor": sum(1 for score in quality_scores if score < self.quality_thresholds['acceptable'])
+            "excellent": excellent,
+            "good": good,
+            "acceptable": acceptable,
+            "poor": poor
         }
         meets_standards = (
-            avg_quality >= self.quality_thresholds['acceptable'] and
-            quality_distribution['poor'] <= len(candidates) * 0.2  # Max 20% poor quality
+            avg_quality >= acceptable_threshold and
+            quality_distribution['poor'] <= max_poor
         )
         return {
             "job_category": job_category,
@@ -233,17 +537,20 @@ class EnhancedValidationAgent:
         if evaluation_score < self.evaluation_thresholds['minimum_acceptable'] and quality_score < self.quality_thresholds['good']:
             return True, f"Both evaluation ({evaluation_score:.3f}) and quality ({quality_score:.3f}) scores are concerning"
         return False, "Scores meet quality standards"
-    def _calculate_string_similarity(self, str1: str, str2: str) -> float:
-        """Calculate similarity between two strings."""
+    def _calculate_string_similarity(self, str1: str, str2: str, lowered: bool = False) -> float:
+        """Calculate similarity between two strings (pass lowered=True if both are already lower-cased)."""
         if not str1 or not str2:
             return 0.0
-        words1 = set(str1.lower().split())
-        words2 = set(str2.lower().split())
+        if not lowered:
+            str1 = str1.lower()
+            str2 = str2.lower()
+        words1 = set(str1.split())
+        words2 = set(str2.split())
         if not words1 or not words2:
             return 0.0
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        return len(intersection) / len(union) if union else 0.0
+        # |A ∪ B| = |A| + |B| - |A ∩ B|, so the union set never needs to be built
+        intersection = len(words1 & words2)
+        return intersection / (len(words1) + len(words2) - intersection)
     def _classify_experience_level(self, years: int) -> str:
         """Classify experience level based on years."""
         if years >= 10:
@@ -254,25 +561,18 @@ class EnhancedValidationAgent:
             return "junior"
         else:
             return "entry-level"
-    def _extract_experience_indicators(self, summary: str) -> List[str]:
-        """Extract experience indicators from summary."""
-        if not summary:
-            return []
+    def _extract_experience_indicators(self, summary_terms: Set[str]) -> List[str]:
+        """Extract experience indicators from the keywords found in a summary."""
         indicators = []
-        summary_lower = summary.lower()
-        leadership_terms = ['led', 'managed', 'directed', 'supervised', 'oversaw', 'headed']
-        for term in leadership_terms:
-            if term in summary_lower:
-                indicators.append(f"Leadership: {term}")
-        achievement_terms = ['achieved', 'improved', 'increased', 'reduced', 'delivered', 'implemented']
-        for term in achievement_terms:
-            if term in summary_lower:
-                indicators.append(f"Achievement: {term}")
-        skill_terms = ['expertise', 'proficient', 'skilled', 'experienced', 'specialist']
-        for term in skill_terms:
-            if term in summary_lower:
-                indicators.append(f"Skill: {term}")
-        return indicators[:10]  # Limit to top 10
+        if not summary_terms:
+            return indicators
+        for category, terms in _EXPERIENCE_CATEGORIES:
+            for term in terms:
+                if term in summary_terms:
+                    indicators.append(f"{category}: {term}")
+                    if len(indicators) == 10:  # Limit to top 10
+                        return indicators
+        return indicators
     def _validate_profile_completeness(self, candidate: CandidateProfile) -> Dict[str, Any]:
         """Validate profile completeness."""
         completeness = {
@@ -340,6 +640,20 @@ class EnhancedValidationAgent:
         if quality_distribution['excellent'] == 0:
             recommendations.append("Expand search to find more highly qualified candidates")
         return recommendations 
+    def _fetch_full_doc(self, collection, mongo_id: Any) -> Optional[Dict[str, Any]]:
+        """Fetch a candidate's MongoDB document (minus its embedding) through a small sliding-window cache."""
+        mongo_doc = self._doc_cache.get(mongo_id)
+        if mongo_doc is not None:
+            self._doc_cache.move_to_end(mongo_id)
+            # The document is handed out as raw_data, so callers must not share the cached one
+            return copy.deepcopy(mongo_doc)
+        # The embedding vector is never used downstream and would dominate transfer and cache size
+        mongo_doc = collection.find_one({"_id": mongo_id}, {"embedding": 0})
+        if mongo_doc:
+            self._doc_cache[mongo_id] = copy.deepcopy(mongo_doc)
+            if len(self._doc_cache) > _DOC_CACHE_SIZE:
+                self._doc_cache.popitem(last=False)
+        return mongo_doc
     def get_full_candidate_data_from_mongodb(self, candidate_id: str) -> Optional[Dict[str, Any]]:
         """Extract complete candidate data from MongoDB."""
         collection = self.get_mongo_collection()
@@ -355,7 +669,7 @@ class EnhancedValidationAgent:
                     mongo_id = candidate_id
             else:
                 mongo_id = candidate_id
-            mongo_doc = collection.find_one({"_id": mongo_id})
+            mongo_doc = self._fetch_full_doc(collection, mongo_id)
             if not mongo_doc:
                 logger.warning(f"Candidate {candidate_id} not found in MongoDB")
                 return None
@@ -392,31 +706,20 @@ class EnhancedValidationAgent:
                 "recommendations": []
             }
         candidate_summary = self._prepare_candidate_summary_for_gpt(candidate_data)
+        # The prompt is fully determined by the category and the prepared profile text
+        cache_key = (job_category, hashlib.blake2b(candidate_summary.encode("utf-8"), digest_size=16).digest())
+        cached = self._gpt_validation_cache.get(cache_key)
+        if cached is not None:
+            self._gpt_validation_cache.move_to_end(cache_key)
+            logger.debug(f"GPT validation cache hit for {candidate_data.get('name', 'Unknown')}")
+            return copy.deepcopy(cached)
         job_requirements = self._get_job_requirements_for_gpt(job_category)
-        prompt = f"""
-You are an expert recruiter with deep knowledge across all professional domains. 
-Your task is to evaluate if a candidate is truly suitable for a specific job category.
-JOB CATEGORY: {job_category.replace('_', ' ').replace('.yml', '').title()}
-JOB REQUIREMENTS:
-{job_requirements}
-CANDIDATE PROFILE:
-{candidate_summary}
-Please evaluate this candidate's suitability for the {job_category} role.
-Respond in JSON format:
-{{
-    "is_suitable": true/false,
-    "confidence": 0.0-1.0,
-    "reasoning": "Detailed explanation of why the candidate is or isn't suitable",
-    "strengths": ["List of candidate strengths relevant to the role"],
-    "weaknesses": ["List of concerns or gaps"],
-    "experience_match": 0.0-1.0,
-    "skills_match": 0.0-1.0,
-    "education_match": 0.0-1.0,
-    "overall_score": 0.0-1.0,
-    "recommendations": ["What would make this candidate more suitable"]
-}}
-Be strict in your evaluation. Only mark as suitable if the candidate genuinely fits the role requirements.
-"""
+        prompt = _GPT_VALIDATION_PROMPT.format(
+            job_title=job_category.replace('_', ' ').replace('.yml', '').title(),
+            job_requirements=job_requirements,
+            candidate_summary=candidate_summary,
+            job_category=job_category
+        )
         try:
             response = gpt_service.client.chat.completions.create(
                 model=gpt_service.model,
@@ -425,19 +728,14 @@ Be strict in your evaluation. Only mark as suitable if the candidate genuinely f
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.1,
-                max_tokens=800
+                max_tokens=500,
+                response_format={"type": "json_schema", "json_schema": _GPT_VALIDATION_SCHEMA}
             )
-            result_text = response.choices[0].message.content.strip()
-            import json
-            validation_result = json.loads(result_text)
-            validation_result.setdefault("is_suitable", False)
-            validation_result.setdefault("confidence", 0.0)
-            validation_result.setdefault("reasoning", "No reasoning provided")
-            validation_result.setdefault("strengths", [])
-            validation_result.setdefault("weaknesses", [])
-            validation_result.setdefault("overall_score", 0.0)
-            validation_result.setdefault("recommendations", [])
+            validation_result = json.loads(response.choices[0].message.content)
             logger.info(f"GPT validation for {candidate_data.get('name', 'Unknown')}: suitable={validation_result['is_suitable']}, score={validation_result['overall_score']:.3f}")
+            self._gpt_validation_cache[cache_key] = copy.deepcopy(validation_result)
+            if len(self._gpt_validation_cache) > _GPT_CACHE_SIZE:
+                self._gpt_validation_cache.popitem(last=False)
             return validation_result
         except Exception as e:
             logger.error(f"GPT validation failed: {e}")
@@ -452,35 +750,18 @@ Be strict in your evaluation. Only mark as suitable if the candidate genuinely f
             }
     def _prepare_candidate_summary_for_gpt(self, candidate_data: Dict[str, Any]) -> str:
         """Prepare comprehensive candidate summary for GPT evaluation."""
-        summary_parts = []
-        if candidate_data.get("name"):
-            summary_parts.append(f"Name: {candidate_data['name']}")
-        if candidate_data.get("position"):
-            summary_parts.append(f"Current Position: {candidate_data['position']}")
-        if candidate_data.get("company"):
-            summary_parts.append(f"Current Company: {candidate_data['company']}")
-        if candidate_data.get("location"):
-            summary_parts.append(f"Location: {candidate_data['location']}")
-        if candidate_data.get("industry"):
-            summary_parts.append(f"Industry: {candidate_data['industry']}")
-        if candidate_data.get("education"):
-            summary_parts.append(f"Education: {candidate_data['education']}")
-        if candidate_data.get("experience"):
-            summary_parts.append(f"Experience: {candidate_data['experience']}")
-        if candidate_data.get("skills"):
-            skills_str = ", ".join(candidate_data["skills"]) if isinstance(candidate_data["skills"], list) else str(candidate_data["skills"])
-            summary_parts.append(f"Skills: {skills_str}")
-        if candidate_data.get("summary"):
-            summary_parts.append(f"Profile Summary: {candidate_data['summary']}")
-        if candidate_data.get("full_profile"):
-            summary_parts.append(f"Full Profile: {candidate_data['full_profile']}")
-        return "\n".join(summary_parts)
+        return "\n".join(
+            f"{label}: {', '.join(value) if key == 'skills' and isinstance(value, list) else value}"
+            for label, key in _GPT_PROFILE_FIELDS
+            if (value := candidate_data.get(key))
+        )
     def _get_job_requirements_for_gpt(self, job_category: str) -> str:
         """Get detailed job requirements for GPT evaluation."""
+        cached = self._requirements_cache.get(job_category)
+        if cached is not None:
+            return cached
         try:
-            import json
-            with open("src/config/prompts.json", "r") as f:
-                prompts_config = json.load(f)
+            prompts_config = _load_prompts_config()
             category_key = job_category.replace(".yml", "")
             hard_filters = prompts_config.get("hard_filters", {}).get(category_key, {})
             must_have = hard_filters.get("must_have", [])
@@ -496,76 +777,12 @@ Be strict in your evaluation. Only mark as suitable if the candidate genuinely f
             specific_requirements = self._get_specific_job_requirements(category_key)
             if specific_requirements:
                 requirements.extend(specific_requirements)
-            return "\n".join(requirements) if requirements else f"Requirements for {job_category}"
+            requirements_text = "\n".join(requirements) if requirements else f"Requirements for {job_category}"
+            self._requirements_cache[job_category] = requirements_text
+            return requirements_text
         except Exception as e:
             logger.warning(f"Could not load job requirements: {e}")
             return f"Standard requirements for {job_category}"
-    def _get_specific_job_requirements(self, category_key: str) -> List[str]:
+    def _get_specific_job_requirements(self, category_key: str) -> Tuple[str, ...]:
         """Get specific requirements for each job category."""
-        requirements_map = {
-            "tax_lawyer": [
-                "Must have JD (Juris Doctor) degree",
-                "Must be licensed attorney",
-                "Must have tax law experience",
-                "Should have IRS experience",
-                "Should have corporate tax knowledge"
-            ],
-            "junior_corporate_lawyer": [
-                "Must have JD degree", 
-                "Must be licensed attorney",
-                "Should have corporate law experience",
-                "Should have M&A experience",
-                "Entry to mid-level experience"
-            ],
-            "radiology": [
-                "Must have MD degree",
-                "Must have radiology residency/fellowship",
-                "Must have medical imaging experience",
-                "Should be board certified",
-                "Should have DICOM experience"
-            ],
-            "doctors_md": [
-                "Must have MD degree",
-                "Must have medical residency",
-                "Must be licensed physician",
-                "Should have clinical experience",
-                "Should have patient care experience"
-            ],
-            "biology_expert": [
-                "Must have advanced degree in biology/life sciences",
-                "Should have research experience",
-                "Should have publication record",
-                "Should have laboratory experience"
-            ],
-            "mathematics_phd": [
-                "Must have PhD in Mathematics",
-                "Should have research experience",
-                "Should have publication record",
-                "Should have theoretical/applied math expertise"
-            ],
-            "quantitative_finance": [
-                "Should have finance/economics degree",
-                "Must have quantitative analysis experience",
-                "Should have financial modeling skills",
-                "Should have programming/statistical skills"
-            ],
-            "bankers": [
-                "Should have finance/business degree",
-                "Must have banking experience",
-                "Should have client relationship experience",
-                "Should have financial services background"
-            ],
-            "mechanical_engineers": [
-                "Must have engineering degree",
-                "Must have mechanical engineering experience",
-                "Should have design/manufacturing experience",
-                "Should have technical project experience"
-            ],
-            "anthropology": [
-                "Must have degree in anthropology/social sciences",
-                "Should have research experience",
-                "Should have fieldwork experience",
-                "Should have cultural analysis skills"
-            ]
-        }
-        return requirements_map.get(category_key, []) 
\ No newline at end of file
+        return _SPECIFIC_JOB_REQUIREMENTS.get(category_key, ()) 
\ No newline at end of file
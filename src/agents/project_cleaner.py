@@ -7,19 +7,62 @@ and organizes the codebase for professional submission.
 import os
 import shutil
 import glob
-from typing import List, Dict, Set
+import fnmatch
+import re
+from typing import List, Dict, Set, Tuple, FrozenSet
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+_PRUNED_DIRS = frozenset({"venv"})
+_USELESS_NAMES = frozenset({
+    "README_IMPROVEMENTS.md",
+    "PROJECT_STRUCTURE.md",
+    "__pycache__",
+    ".pytest_cache",
+    ".vscode",
+    ".idea"
+})
+_USELESS_PATTERNS = (
+    "*search_agent*.py",
+    "*test_script*.py",
+    "*_improved.py",
+    "*_final.py",
+    "*_optimized.py",
+    "*_enhanced.py",
+    "*.log",
+    "*logs*",
+    "*.tmp",
+    "*.temp",
+    "*~",
+    "*.bak",
+    "*submission_format_example.json",
+    "*test_soft_filters.py",
+    "*test_domain_validation.py",
+    "*.pyc",
+    "*.pyo",
+    "*.swp"
+)
+_USELESS_PATTERN_RE = re.compile("|".join(fnmatch.translate(pattern) for pattern in _USELESS_PATTERNS))
+_DUPLICATE_PATTERNS = tuple(
+    (base_file, re.compile(fnmatch.translate(pattern)))
+    for base_file, pattern in (
+        ("search_agent.py", "*search_agent*.py"),
+        ("main.py", "*main*.py"),
+        ("README.md", "README*.md")
+    )
+)
 class ProjectCleanerAgent:
     """
     Agent responsible for maintaining clean, professional project structure.
     """
-    def __init__(self, project_root: str = "."):
+    def __init__(self, project_root: str = ".", max_workers: int = 8):
         self.project_root = Path(project_root)
+        self.max_workers = max(1, min(max_workers, os.cpu_count() or 1))
+        self._root_prefix_len = len(os.path.join(str(self.project_root), ""))
         self.files_to_keep = self._define_essential_files()
         self.directories_to_keep = self._define_essential_directories()
-    def _define_essential_files(self) -> Set[str]:
-        """Define files that should be kept."""
-        return {
+    def _define_essential_files(self) -> FrozenSet[Tuple[str, ...]]:
+        """Define files that should be kept, as path-part tuples so lookups are separator independent."""
+        return frozenset(tuple(path.split("/")) for path in {
             "src/main.py",
             "src/config/settings.py", 
             "src/config/prompts.json",
@@ -41,7 +84,7 @@ class ProjectCleanerAgent:
             "migrate_to_turbo.py",
             "quick_start.sh",
             "README.md"
-        }
+        })
     def _define_essential_directories(self) -> Set[str]:
         """Define directories that should be kept."""
         return {
@@ -55,6 +98,9 @@ class ProjectCleanerAgent:
         }
     def analyze_project_structure(self) -> Dict[str, List[str]]:
         """Analyze current project structure and categorize files."""
+        return self._scan_project()[0]
+    def _scan_project(self) -> Tuple[Dict[str, List[str]], Dict[str, int]]:
+        """Categorize project files, also returning the sizes of useless files seen during the walk."""
         analysis = {
             "essential_files": [],
             "useless_files": [],
@@ -62,76 +108,81 @@ class ProjectCleanerAgent:
             "large_files": [],
             "empty_directories": []
         }
-        for file_path in self.project_root.rglob("*"):
-            if file_path.is_file():
-                relative_path = str(file_path.relative_to(self.project_root))
-                if any(part.startswith('.') for part in file_path.parts) or 'venv' in file_path.parts:
-                    if relative_path not in self.files_to_keep:
-                        continue
-                if relative_path in self.files_to_keep:
-                    analysis["essential_files"].append(relative_path)
-                elif self._is_useless_file(file_path):
-                    analysis["useless_files"].append(relative_path)
-                elif file_path.stat().st_size > 10 * 1024 * 1024:  # > 10MB
-                    analysis["large_files"].append(f"{relative_path} ({file_path.stat().st_size // (1024*1024)}MB)")
-        for dir_path in self.project_root.rglob("*"):
-            if dir_path.is_dir() and not any(dir_path.iterdir()):
-                relative_path = str(dir_path.relative_to(self.project_root))
-                analysis["empty_directories"].append(relative_path)
-        analysis["duplicate_files"] = self._find_duplicate_files()
-        return analysis
-    def _is_useless_file(self, file_path: Path) -> bool:
+        file_sizes = {}
+        duplicate_candidates = {base_file: [] for base_file, _ in _DUPLICATE_PATTERNS}
+        for entry, parts in self._iter_project_files(analysis["empty_directories"]):
+            if len(parts) == 1:
+                for base_file, pattern_re in _DUPLICATE_PATTERNS:
+                    if pattern_re.match(entry.name):
+                        duplicate_candidates[base_file].append(entry.name)
+            if parts in self.files_to_keep:
+                analysis["essential_files"].append(entry.path[self._root_prefix_len:])
+            elif entry.name.startswith('.'):
+                continue
+            elif self._is_useless_file(entry.name):
+                relative_path = entry.path[self._root_prefix_len:]
+                analysis["useless_files"].append(relative_path)
+                file_sizes[relative_path] = entry.stat().st_size
+            else:
+                size = entry.stat().st_size
+                if size > 10 * 1024 * 1024:  # > 10MB
+                    analysis["large_files"].append(f"{entry.path[self._root_prefix_len:]} ({size // (1024*1024)}MB)")
+        analysis["duplicate_files"] = self._find_duplicate_files(duplicate_candidates)
+        return analysis, file_sizes
+    def _iter_project_files(self, empty_directories: List[str]):
+        """Yield (entry, relative path parts) for files, pruning hidden and virtualenv directories before descending.
+        Top-level subdirectories are walked in parallel; directories that turn out to have no entries
+        at all are appended to empty_directories.
+        """
+        subdirectories = []
+        with os.scandir(str(self.project_root)) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith('.') and entry.name not in _PRUNED_DIRS:
+                        subdirectories.append(entry)
+                elif entry.is_file():
+                    yield entry, (entry.name,)
+        if not subdirectories:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(subdirectories))) as executor:
+            for files, empties in executor.map(self._walk_subtree, subdirectories):
+                empty_directories.extend(empties)
+                yield from files
+    def _walk_subtree(self, top: os.DirEntry) -> Tuple[List[Tuple[os.DirEntry, Tuple[str, ...]]], List[str]]:
+        """Walk one top-level subdirectory, returning its files and empty directories."""
+        files, empties = [], []
+        stack = [(top.path, (top.name,))]
+        while stack:
+            dir_path, dir_parts = stack.pop()
+            is_empty = True
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    is_empty = False
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith('.') and entry.name not in _PRUNED_DIRS:
+                            stack.append((entry.path, dir_parts + (entry.name,)))
+                    elif entry.is_file():
+                        files.append((entry, dir_parts + (entry.name,)))
+            if is_empty:
+                empties.append(dir_path[self._root_prefix_len:])
+        return files, empties
+    def _is_useless_file(self, file_name: str) -> bool:
         """Determine if a file is useless and can be removed."""
-        useless_patterns = [
-            "*search_agent*.py",
-            "*test_script*.py", 
-            "*_improved.py",
-            "*_final.py",
-            "*_optimized.py",
-            "*_enhanced.py",
-            "*.log",
-            "*logs*",
-            "*.tmp",
-            "*.temp",
-            "*~",
-            "*.bak",
-            "*submission_format_example.json",
-            "*test_soft_filters.py",
-            "*test_domain_validation.py",
-            "README_IMPROVEMENTS.md",
-            "PROJECT_STRUCTURE.md",
-            "__pycache__",
-            "*.pyc",
-            "*.pyo",
-            ".pytest_cache",
-            ".vscode",
-            ".idea",
-            "*.swp"
-        ]
-        file_name = file_path.name
-        relative_path = str(file_path.relative_to(self.project_root))
-        for pattern in useless_patterns:
-            if file_path.match(pattern) or relative_path in pattern:
-                return True
+        if file_name in _USELESS_NAMES or _USELESS_PATTERN_RE.match(file_name):
+            return True
         if "submission" in file_name.lower() and file_name != "create_final_submission.py":
             return True
         return False
-    def _find_duplicate_files(self) -> List[str]:
-        """Find potential duplicate files."""
+    def _find_duplicate_files(self, candidates: Dict[str, List[str]]) -> List[str]:
+        """Find potential duplicate files among the top-level matches collected during the walk."""
         duplicates = []
-        duplicate_patterns = [
-            ("search_agent.py", "*search_agent*.py"),
-            ("main.py", "*main*.py"),
-            ("README.md", "README*.md")
-        ]
-        for base_file, pattern in duplicate_patterns:
-            matches = list(self.project_root.glob(pattern))
+        for base_file, matches in candidates.items():
             if len(matches) > 1:
-                duplicates.extend([str(p.relative_to(self.project_root)) for p in matches if p.name != base_file])
+                duplicates.extend(name for name in matches if name != base_file)
         return duplicates
     def clean_project(self, dry_run: bool = True) -> Dict[str, int]:
         """Clean the project structure."""
-        analysis = self.analyze_project_structure()
+        analysis, file_sizes = self._scan_project()
         stats = {
             "files_removed": 0,
             "directories_removed": 0,
@@ -144,7 +195,7 @@ class ProjectCleanerAgent:
             for file_path in analysis["useless_files"]:
                 full_path = self.project_root / file_path
                 if full_path.exists():
-                    size_mb = full_path.stat().st_size / (1024 * 1024)
+                    size_mb = file_sizes[file_path] / (1024 * 1024)
                     print(f"  ❌ {file_path} ({size_mb:.1f}MB)")
                     if not dry_run:
                         full_path.unlink()
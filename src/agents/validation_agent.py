@@ -7,10 +7,18 @@ Automatically triggers improvements and validates output quality.
 import os
 import sys
 import json
+import re
 import time
+import copy
+import hashlib
+import functools
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
+import numpy as np
+from openai import OpenAIError
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 from src.models.candidate import SearchQuery, SearchStrategy, CandidateProfile
 from src.services.search_service import search_service
@@ -18,13 +26,42 @@ from src.services.gpt_service import gpt_service
 from src.services.evaluation_service import evaluation_service
 from src.utils.logger import setup_logger
 logger = setup_logger("validation_agent", level="INFO")
+_GPT_CACHE_SIZE = 256
+_DOMAIN_KEYWORDS = MappingProxyType({
+    "mathematics_phd": ("mathematics", "mathematical", "PhD", "theorem", "analysis", "algebra"),
+    "biology_expert": ("biology", "molecular", "cell", "genomics", "biotechnology", "PhD"),
+    "radiology": ("radiology", "imaging", "radiologist", "MD", "medical", "diagnostic"),
+    "tax_lawyer": ("tax", "attorney", "lawyer", "IRS", "legal", "JD"),
+})
+_DEFAULT_DOMAIN_KEYWORDS = ("professional", "expert")
+_QUALITY_WEIGHT_KEYS = (
+    "domain_relevance",
+    "education_alignment",
+    "qualifications",
+    "domain_specificity",
+    "quality_consistency",
+    "profile_completeness",
+    "career_progression"
+)
+_QUALITY_WEIGHTS = np.array([0.25, 0.20, 0.15, 0.15, 0.10, 0.10, 0.05])
+@functools.lru_cache(maxsize=None)
+def _keyword_pattern(keywords: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compile lowercased keywords into one lookahead alternation so overlapping hits are all found.
+    The alternation captures only one keyword per position, so None is returned when a keyword
+    repeats or is a prefix of another and distinct hits could be undercounted.
+    """
+    lowered = [keyword.lower() for keyword in keywords]
+    if any(i != j and other.startswith(keyword)
+           for i, keyword in enumerate(lowered) for j, other in enumerate(lowered)):
+        return None
+    return re.compile("(?=(" + "|".join(re.escape(keyword) for keyword in lowered) + "))")
 class ValidationStatus(Enum):
     EXCELLENT = "excellent"
     GOOD = "good"
     MODERATE = "moderate"
     POOR = "poor"
     FAILED = "failed"
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     status: ValidationStatus
     score: float
@@ -33,13 +70,13 @@ class ValidationResult:
     metrics: Dict[str, float]
     should_retry: bool = False
     should_escalate: bool = False
-@dataclass
+@dataclass(slots=True)
 class SearchSession:
     query: SearchQuery
     candidates: List[CandidateProfile]
     validation_results: List[ValidationResult]
     iterations: int = 0
-    start_time: float = 0
+    start_time: float = 0  # time.monotonic() reading, only meaningful for durations
     improvements_made: List[str] = None
     def __post_init__(self):
         if self.improvements_made is None:
@@ -54,6 +91,7 @@ class IntelligentValidationAgent:
         self.performance_history: List[Dict] = []
         self.improvement_threshold = 0.7  # Minimum acceptable quality score
         self.max_iterations = 3  # Max retry attempts per search
+        self._quality_analysis_cache: "OrderedDict[Tuple[str, bytes], Dict[str, Any]]" = OrderedDict()
         logger.info("🤖 Intelligent Validation Agent initialized")
     def validate_candidates(
         self, 
@@ -100,12 +138,20 @@ class IntelligentValidationAgent:
             return self._fallback_quality_metrics(candidates, job_category)
         sample_candidates = candidates[:5]
         domain_name = job_category.replace("_", " ").replace(".yml", "")
-        candidates_text = ""
-        for i, candidate in enumerate(sample_candidates, 1):
-            candidates_text += f"""
+        candidates_text = "".join(
+            f"""
         {i}. Name: {candidate.name}
            Summary: {candidate.summary or 'No summary available'}
         """
+            for i, candidate in enumerate(sample_candidates, 1)
+        )
+        # Iterations often resample the same top candidates; the prompt depends only on these inputs
+        cache_key = (job_category, hashlib.blake2b(candidates_text.encode("utf-8"), digest_size=16).digest())
+        cached = self._quality_analysis_cache.get(cache_key)
+        if cached is not None:
+            self._quality_analysis_cache.move_to_end(cache_key)
+            logger.debug("GPT quality analysis cache hit")
+            return copy.deepcopy(cached)
         prompt = f"""
         Analyze the quality of these candidates for: {domain_name}
         Evaluate each candidate on these dimensions (0.0 to 1.0):
@@ -145,10 +191,11 @@ class IntelligentValidationAgent:
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.1,
-                max_tokens=800
+                max_tokens=350,
+                seed=0,
+                response_format={"type": "json_object"}
             )
-            result_text = response.choices[0].message.content.strip()
-            metrics = json.loads(result_text)
+            metrics = json.loads(response.choices[0].message.content)
             numeric_keys = [
                 "domain_relevance", "experience_level", "education_alignment",
                 "qualifications", "career_progression", "domain_specificity",
@@ -156,8 +203,11 @@ class IntelligentValidationAgent:
             ]
             for key in numeric_keys:
                 metrics[key] = max(0.0, min(1.0, float(metrics.get(key, 0.5))))
+            self._quality_analysis_cache[cache_key] = copy.deepcopy(metrics)
+            if len(self._quality_analysis_cache) > _GPT_CACHE_SIZE:
+                self._quality_analysis_cache.popitem(last=False)
             return metrics
-        except Exception as e:
+        except (OpenAIError, json.JSONDecodeError, TypeError, ValueError) as e:
             logger.error(f"GPT quality analysis failed: {e}")
             return self._fallback_quality_metrics(candidates, job_category)
     def _fallback_quality_metrics(
@@ -167,11 +217,17 @@ class IntelligentValidationAgent:
     ) -> Dict[str, float]:
         """Fallback quality metrics when GPT is unavailable."""
         domain_keywords = self._get_domain_keywords(job_category)
+        keyword_re = _keyword_pattern(domain_keywords)
         relevance_scores = []
         completeness_scores = []
         for candidate in candidates[:10]:  # Check top 10
             summary_lower = (candidate.summary or "").lower()
-            keyword_matches = sum(1 for keyword in domain_keywords if keyword.lower() in summary_lower)
+            if not summary_lower:
+                keyword_matches = 0
+            elif keyword_re is not None:
+                keyword_matches = len(set(keyword_re.findall(summary_lower)))
+            else:
+                keyword_matches = sum(1 for keyword in domain_keywords if keyword.lower() in summary_lower)
             relevance_score = min(1.0, keyword_matches / max(len(domain_keywords), 1))
             relevance_scores.append(relevance_score)
             completeness = 0.0
@@ -194,30 +250,17 @@ class IntelligentValidationAgent:
             "top_strengths": ["Candidates found"],
             "main_concerns": ["Limited analysis without GPT"]
         }
-    def _get_domain_keywords(self, job_category: str) -> List[str]:
+    def _get_domain_keywords(self, job_category: str) -> Tuple[str, ...]:
         """Get expected keywords for a domain."""
-        domain_keywords = {
-            "mathematics_phd": ["mathematics", "mathematical", "PhD", "theorem", "analysis", "algebra"],
-            "biology_expert": ["biology", "molecular", "cell", "genomics", "biotechnology", "PhD"],
-            "radiology": ["radiology", "imaging", "radiologist", "MD", "medical", "diagnostic"],
-            "tax_lawyer": ["tax", "attorney", "lawyer", "IRS", "legal", "JD"],
-        }
-        return domain_keywords.get(job_category.replace(".yml", ""), ["professional", "expert"])
+        return _DOMAIN_KEYWORDS.get(job_category.replace(".yml", ""), _DEFAULT_DOMAIN_KEYWORDS)
     def _calculate_quality_score(self, metrics: Dict[str, float]) -> float:
         """Calculate weighted quality score from metrics."""
-        weights = {
-            "domain_relevance": 0.25,
-            "education_alignment": 0.20,
-            "qualifications": 0.15,
-            "domain_specificity": 0.15,
-            "quality_consistency": 0.10,
-            "profile_completeness": 0.10,
-            "career_progression": 0.05
-        }
-        score = 0.0
-        for metric, weight in weights.items():
-            score += metrics.get(metric, 0.5) * weight
-        return min(1.0, max(0.0, score))
+        values = np.fromiter(
+            (metrics.get(metric, 0.5) for metric in _QUALITY_WEIGHT_KEYS),
+            dtype=np.float64,
+            count=len(_QUALITY_WEIGHT_KEYS)
+        )
+        return float(np.clip(_QUALITY_WEIGHTS @ values, 0.0, 1.0))
     def _determine_status_and_suggestions(
         self, 
         quality_score: float, 
@@ -275,7 +318,7 @@ class IntelligentValidationAgent:
             query=query,
             candidates=[],
             validation_results=[],
-            start_time=time.time()
+            start_time=time.monotonic()
         )
         self.sessions[session_id] = session
         best_candidates = []
@@ -297,7 +340,7 @@ class IntelligentValidationAgent:
                 improvements = self._apply_improvements(query, validation.suggestions, iteration)
                 session.improvements_made.extend(improvements)
                 logger.info(f"🔧 Applied improvements: {', '.join(improvements)}")
-        duration = time.time() - session.start_time
+        duration = time.monotonic() - session.start_time
         logger.info(f"✅ Search completed in {duration:.1f}s with {session.iterations} iterations")
         logger.info(f"🏆 Best score: {best_score:.2f} ({len(best_candidates)} candidates)")
         return best_candidates, session.validation_results
@@ -348,7 +391,7 @@ class IntelligentValidationAgent:
             },
             "performance": {
                 "iterations": session.iterations,
-                "duration": time.time() - session.start_time,
+                "duration": time.monotonic() - session.start_time,
                 "final_candidate_count": len(session.candidates),
                 "improvements_made": session.improvements_made
             },